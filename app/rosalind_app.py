@@ -11,7 +11,10 @@ st.set_page_config(page_title="Rosalind – AI Data Analyst", layout="wide")
 st.title("Rosalind – Your AI Data Analyst")
 st.markdown("**Upload your CSV/Excel → Ask anything → Get insights, charts & DAX**")
 
-agent = RosalindAgent(model="grok-beta", verbose=False)
+# Keep one agent per browser session – Streamlit reruns this script on every interaction
+if "agent" not in st.session_state:
+    st.session_state.agent = RosalindAgent(model="grok-beta", verbose=False)
+agent = st.session_state.agent
 
 uploaded_file = st.file_uploader("Upload your data", type=["csv", "xlsx"])
 
@@ -19,13 +22,17 @@ if uploaded_file:
     df = pd.read_csv(uploaded_file) if uploaded_file.name.endswith('.csv') else pd.read_excel(uploaded_file)
     st.success(f"Loaded {uploaded_file.name} → {df.shape[0]:,} rows × {df.shape[1]} columns")
     
-    agent.memory.set_dataframe(df, uploaded_file.name)
+    upload_key = (uploaded_file.name, uploaded_file.size)
+    if st.session_state.get("upload_key") != upload_key:
+        agent.memory.set_dataframe(df, uploaded_file.name)
+        st.session_state.upload_key = upload_key
 
     question = st.text_input("Ask Rosalind anything about this data:", placeholder="Why did sales drop in December?")
+    fast = st.checkbox("Fast answer (estimate from a sample)", value=df.shape[0] > 1_000_000)
     
     if st.button("Analyze") and question:
         with st.spinner("Rosalind is thinking..."):
-            answer = agent.chat(question)
+            answer = agent.chat(question, approximate=fast, refine=fast)
             st.markdown(answer)
             
             # Show saved charts
@@ -34,3 +41,9 @@ if uploaded_file:
                 st.markdown(f"**Chart:** {chart}")
                 with open(f"outputs/visualizations/{chart}", "r") as f:
                     st.components.v1.html(f.read(), height=600)
+
+    # Exact figures from the background refinement show up on the next rerun once ready
+    exact = agent.refined_summary()
+    if exact:
+        with st.expander("Exact figures (computed in the background)"):
+            st.text(exact)
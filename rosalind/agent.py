@@ -1,8 +1,10 @@
 # rosalind/agent.py
 from __future__ import annotations
 
-from typing import Optional, List, TypedDict, Annotated
+from typing import Optional, List, Dict, TypedDict, Annotated
+from concurrent.futures import Future, ThreadPoolExecutor
 import operator
+from pathlib import Path
 
 import pandas as pd
 
@@ -16,6 +18,7 @@ from langchain_community.tools import PythonREPLTool
 
 from rosalind.prompts import SYSTEM_PROMPT
 from rosalind.memory import ConversationMemory
+from rosalind.sampling import approximate_summary
 from rosalind.tools import (
     load_data, clean_data,
     plot, create_line_chart, create_bar_chart, create_scatter_chart,
@@ -40,18 +43,67 @@ class RosalindAgent:
         self.verbose = verbose
         self._agent_executor = None
 
+        # Exact column stats computed in the background after approximate answers,
+        # keyed by memory.version so they always match the dataset they describe
+        self._refine_pool = ThreadPoolExecutor(max_workers=1)
+        self.refinements: Dict[int, Future] = {}
+
         self.llm = ChatOpenAI(
             model="gpt-4o",
             temperature=0,
             openai_api_key=openai_api_key,
         )
 
+        def dax_for_dataset(request: str = "full measure library") -> str:
+            """
+            Generate ready-to-paste Power BI DAX for the currently loaded dataset.
+            Ask for a "full library" to get totals, time intelligence and ratios
+            for every numeric column, or name specific measures (YoY, MTD, running total).
+            """
+            # DAX depends on the schema and real row count, never on the approximate-mode sample
+            df = self.memory.get_dataframe(sample=False)
+            table_name = Path(self.memory.dataset_name).stem or "Data"
+            return create_dax_snippets(
+                request, {"table_name": table_name}, df=df, version=self.memory.version
+            )
+
+        # Chart tools read the loaded data from memory (the sample in approximate mode)
+        def chart_title(title: str) -> str:
+            if not self.memory.use_sample:
+                return title
+            return f"{title} (estimate, {len(self.memory.sample):,}-row sample)"
+
+        def line_chart(x: str, y: str, title: str = "Trend Over Time", color: Optional[str] = None) -> str:
+            """Line chart of column y against column x for the loaded dataset. Returns the saved file name."""
+            return create_line_chart(self.memory.get_dataframe(), x, y, title=chart_title(title), color=color)
+
+        def bar_chart(x: str, y: str, title: str = "Comparison", color: Optional[str] = None) -> str:
+            """Bar chart of column y by column x for the loaded dataset. Returns the saved file name."""
+            return create_bar_chart(self.memory.get_dataframe(), x, y, title=chart_title(title), color=color)
+
+        def scatter_chart(x: str, y: str, title: str = "Correlation", color: Optional[str] = None) -> str:
+            """Scatter chart of column y against column x for the loaded dataset. Returns the saved file name."""
+            return create_scatter_chart(self.memory.get_dataframe(), x, y, title=chart_title(title), color=color)
+
+        self._repl = PythonREPLTool()
+
+        def python_repl(command: str) -> str:
+            """
+            Run Python code and return what it prints. The loaded dataset is available
+            as `df`; it is a private copy, so changes to it do not alter the stored data.
+            """
+            # Copied on first use per run so the REPL can never mutate memory.df / memory.sample
+            repl_globals = self._repl.python_repl.globals
+            if "df" not in repl_globals and self.memory.df is not None:
+                repl_globals["df"] = self.memory.get_dataframe().copy()
+            return self._repl.run(command)
+
         # All tools
         tools = [
             load_data, clean_data,
-            plot, create_line_chart, create_bar_chart, create_scatter_chart,
-            create_dashboard, create_dax_snippets,
-            PythonREPLTool(),
+            plot, line_chart, bar_chart, scatter_chart,
+            create_dashboard, dax_for_dataset,
+            python_repl,
         ]
 
         # Bind tools to LLM
@@ -87,8 +139,19 @@ class RosalindAgent:
         file_path: Optional[str] = None,
         question: str = "",
         df: Optional[pd.DataFrame] = None,
-        filename: str = "data.csv"
+        filename: str = "data.csv",
+        approximate: bool = False,
+        refine: bool = False
     ) -> str:
+        """
+        Answer a question about the loaded data.
+
+        approximate=True runs the tools against the stratified sample kept in
+        memory and returns estimates with confidence intervals, labelled as such
+        (ignored when the sample already covers every row).
+        refine=True additionally computes the exact column stats in the background;
+        see refined_summary(). Once ready they are also given to later approximate answers.
+        """
         if not question.strip():
             return "Please ask a question about the data."
 
@@ -107,25 +170,66 @@ Past questions: {len(self.memory.memory_entries)}
 Current question: {question}
         """.strip()
 
+        estimate_label = ""
+        has_data = self.memory.df is not None
+        if has_data:
+            context += "\nThe loaded data is available as `df` in the Python tool."
+        approximate = approximate and has_data and len(self.memory.sample) < len(self.memory.df)
+        if approximate:
+            sample = self.memory.get_dataframe(sample=True)
+            total_rows = len(self.memory.df)
+            _, estimate_text = approximate_summary(sample, total_rows)
+            context += (
+                f"\n\nAPPROXIMATE MODE: tools see only a {len(sample):,}-row stratified sample. "
+                f"Scale counts and sums by {total_rows / len(sample):,.2f}, report the intervals "
+                f"below and call every number an estimate.\n{estimate_text}"
+            )
+            exact_text = self.refined_summary()
+            if exact_text:
+                context += f"\n\nExact column stats are already available – prefer them:\n{exact_text}"
+            estimate_label = (
+                f"**Estimate** – based on a {len(sample):,}-row stratified sample "
+                f"of {total_rows:,} rows (95% confidence intervals).\n\n"
+            )
+
         if self.verbose:
             print("\nRosalind is analyzing...\n")
 
-        # Run agent
-        result = self._agent_executor.invoke({
-            "messages": [HumanMessage(content=f"{context}\n\nQuestion: {question}")],
-            "memory": self.memory
-        })
+        # Run agent – tools read the sample instead of the full frame in approximate mode
+        self.memory.use_sample = approximate
+        try:
+            result = self._agent_executor.invoke({
+                "messages": [HumanMessage(content=f"{context}\n\nQuestion: {question}")],
+                "memory": self.memory
+            })
+        finally:
+            self.memory.use_sample = False
+            self._repl.python_repl.globals.pop("df", None)
 
-        final_answer = result["messages"][-1].content
+        final_answer = estimate_label + result["messages"][-1].content
 
         if self.verbose:
             print(final_answer)
 
         # Save to memory
-        self.memory.add_interaction(question, final_answer)
+        self.memory.add_interaction(question, final_answer, {"approximate": approximate})
+
+        # Exact stats need no LLM and never write to memory, so the worker cannot race it
+        if approximate and refine and self.memory.version not in self.refinements:
+            full_df = self.memory.df
+            self.refinements[self.memory.version] = self._refine_pool.submit(
+                approximate_summary, full_df, len(full_df)
+            )
 
         return final_answer
 
-    def chat(self, question: str) -> str:
+    def refined_summary(self) -> Optional[str]:
+        """Exact column stats for the current dataset, if a refine=True run has finished"""
+        future = self.refinements.get(self.memory.version)
+        if future is None or not future.done() or future.exception() is not None:
+            return None
+        return future.result()[1]
+
+    def chat(self, question: str, approximate: bool = False, refine: bool = False) -> str:
         """Continue conversation without reloading data"""
-        return self.analyze(question=question)
+        return self.analyze(question=question, approximate=approximate, refine=refine)
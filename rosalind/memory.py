@@ -5,10 +5,13 @@ import pandas as pd
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+from rosalind.sampling import stratified_sample
+
 class ConversationMemory:
     """
     Simple but powerful memory system:
     - Stores the current dataframe (so tools always have access)
+    - Keeps a stratified sample of it for fast approximate answers
     - Stores past Q&A + insights using FAISS vector store
     """
     
@@ -18,8 +21,13 @@ class ConversationMemory:
         
         # In-memory storage
         self.df: Optional[pd.DataFrame] = None
+        self.sample: Optional[pd.DataFrame] = None
+        # While True, get_dataframe() hands tools the sample (approximate mode)
+        self.use_sample: bool = False
         self.dataset_name: str = ""
         self.dataset_summary: str = ""
+        # Bumped on every set_dataframe so tools can cache per dataset version
+        self.version: int = 0
         
         # FAISS index for semantic memory (future-proof)
         self.dimension = 384  # We'll use sentence-transformers later if needed
@@ -29,15 +37,27 @@ class ConversationMemory:
 
     def set_dataframe(self, df: pd.DataFrame, filename: str = "uploaded_data"):
         """Store the main dataframe that all analysis will use"""
+        if self.df is not None and filename == self.dataset_name and self._same_frame(df):
+            return  # e.g. a Streamlit rerun with the same upload – keep sample and version
         self.df = df.copy()
         self.dataset_name = filename
+        self.version += 1
+        self.sample = stratified_sample(self.df)
         self.dataset_summary = f"{filename} | {df.shape[0]:,} rows × {df.shape[1]} columns | cols: {list(df.columns)}"
         print(f"Memory updated → {self.dataset_summary}")
 
-    def get_dataframe(self) -> pd.DataFrame:
+    def _same_frame(self, df: pd.DataFrame) -> bool:
+        if df.shape != self.df.shape or not df.columns.equals(self.df.columns):
+            return False
+        return df.dtypes.equals(self.df.dtypes) and df.equals(self.df)
+
+    def get_dataframe(self, sample: Optional[bool] = None) -> pd.DataFrame:
+        """Return the full dataframe, or its stratified sample (default: follow use_sample)"""
         if self.df is None:
             raise ValueError("No dataset loaded yet. Use load_data tool first.")
-        return self.df
+        if sample is None:
+            sample = self.use_sample
+        return self.sample if sample else self.df
 
     def add_interaction(self, question: str, answer: str, metadata: Dict[str, Any] = None):
         """Store a Q&A pair for future reference"""
@@ -57,6 +77,7 @@ class ConversationMemory:
     def clear(self):
         """Start fresh"""
         self.df = None
+        self.sample = None
         self.dataset_name = ""
         self.dataset_summary = ""
         self.memory_entries = []
@@ -0,0 +1,161 @@
+# rosalind/sampling.py
+import math
+import numpy as np
+import pandas as pd
+from statistics import NormalDist
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_SAMPLE_ROWS = 100_000
+# Keep the prompt bounded on wide frames
+MAX_SUMMARY_COLUMNS = 30
+# Only low-cardinality text columns are worth stratifying on
+MAX_STRATA = 50
+
+
+def _pick_strata_column(df: pd.DataFrame) -> Optional[str]:
+    """First categorical-looking column with 2..MAX_STRATA distinct values, if any."""
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+            continue
+        if 2 <= series.nunique(dropna=False) <= MAX_STRATA:
+            return col
+    return None
+
+
+def stratified_sample(
+    df: pd.DataFrame,
+    n: int = DEFAULT_SAMPLE_ROWS,
+    strata: Optional[str] = None,
+    random_state: int = 42
+) -> pd.DataFrame:
+    """
+    Proportional stratified sample of roughly n rows.
+    Stratifies on `strata`, or the first low-cardinality categorical column found.
+    Frames with n rows or fewer are returned as-is.
+    """
+    if len(df) <= n:
+        return df
+
+    frac = n / len(df)
+    strata = strata or _pick_strata_column(df)
+    if strata is None:
+        return df.sample(frac=frac, random_state=random_state)
+    return df.groupby(strata, dropna=False, observed=True, group_keys=False).sample(frac=frac, random_state=random_state)
+
+
+def _z(confidence: float) -> float:
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def _numeric_estimate(series: pd.Series, population_rows: int, z: float) -> Dict[str, Any]:
+    """Mean and total with CLT intervals, quartiles with order-statistic intervals."""
+    m = len(series)
+    values = series.dropna().to_numpy(dtype=float)
+    n = len(values)
+    if n == 0:
+        return {}
+
+    # Finite-population correction compares the sample rows with the population rows
+    fpc = math.sqrt(max(1 - m / population_rows, 0.0))
+
+    mean = values.mean()
+    se = (values.std(ddof=1) / math.sqrt(n) * fpc) if n > 1 else 0.0
+
+    # Total = N * per-row mean with missing values counted as 0, which scales by
+    # the estimated non-null population (n / m * N) and carries its uncertainty
+    per_row = series.fillna(0).to_numpy(dtype=float)
+    row_mean = per_row.mean()
+    row_se = (per_row.std(ddof=1) / math.sqrt(m) * fpc) if m > 1 else 0.0
+    result = {
+        "mean": (mean, mean - z * se, mean + z * se),
+        "total": tuple(
+            v * population_rows for v in (row_mean, row_mean - z * row_se, row_mean + z * row_se)
+        ),
+    }
+
+    # Distribution-free CI for a quantile: ranks n*p ± z*sqrt(n*p*(1-p)) of the sorted sample
+    ordered = np.sort(values)
+    for p in (0.25, 0.5, 0.75):
+        spread = z * math.sqrt(n * p * (1 - p)) * fpc
+        lo = int(np.clip(math.floor(n * p - spread), 0, n - 1))
+        hi = int(np.clip(math.ceil(n * p + spread), 0, n - 1))
+        result[f"p{int(p * 100)}"] = (float(np.quantile(ordered, p)), ordered[lo], ordered[hi])
+    return result
+
+
+def _distinct_estimate(values: pd.Series, population_rows: int, z: float) -> Tuple[float, float, float]:
+    """
+    Chao1 estimate of the population distinct count from sample frequencies,
+    with Chao's log-normal confidence interval.
+    """
+    counts = values.value_counts(dropna=True)
+    # Categorical columns also report unused categories with a count of 0
+    counts = counts[counts > 0]
+    observed = len(counts)
+    if len(values) >= population_rows:
+        return observed, observed, observed
+
+    f1 = int((counts == 1).sum())
+    f2 = int((counts == 2).sum())
+    if f2 > 0:
+        unseen = f1 ** 2 / (2 * f2)
+        ratio = f1 / f2
+        var = f2 * (ratio ** 2 / 2 + ratio ** 3 + ratio ** 4 / 4)
+    else:
+        unseen = f1 * (f1 - 1) / 2
+        var = unseen
+    if unseen <= 0:
+        return observed, observed, observed
+
+    k = math.exp(z * math.sqrt(math.log(1 + var / unseen ** 2)))
+    cap = observed + (population_rows - len(values))
+    return (
+        min(observed + unseen, cap),
+        min(observed + unseen / k, cap),
+        min(observed + unseen * k, cap),
+    )
+
+
+def approximate_summary(
+    sample: pd.DataFrame,
+    population_rows: int,
+    confidence: float = 0.95,
+    max_columns: int = MAX_SUMMARY_COLUMNS
+) -> Tuple[Dict[str, Dict[str, Any]], str]:
+    """
+    Estimate per-column statistics for the full dataset from a sample.
+    Returns {column: {stat: (estimate, low, high)}} and a readable summary
+    (limited to max_columns columns). Numeric columns get mean, total and
+    quartiles; text columns get distinct counts. Passing the full frame with
+    population_rows=len(frame) gives exact values, labelled as such.
+    """
+    z = _z(confidence)
+    estimates: Dict[str, Dict[str, Any]] = {}
+    for col in sample.columns:
+        series = sample[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            continue
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            estimates[col] = _numeric_estimate(series, population_rows, z)
+        else:
+            estimates[col] = {"distinct": _distinct_estimate(series, population_rows, z)}
+
+    exact = len(sample) >= population_rows
+    if exact:
+        lines = [f"Exact values for all {population_rows:,} rows:"]
+    else:
+        lines = [
+            f"Estimates from a {len(sample):,}-row sample of {population_rows:,} rows "
+            f"({confidence:.0%} confidence intervals):"
+        ]
+    for col, stats in list(estimates.items())[:max_columns]:
+        if exact:
+            parts = [f"{stat} = {est:,.2f}" for stat, (est, _, _) in stats.items()]
+        else:
+            parts = [f"{stat} ≈ {est:,.2f} [{lo:,.2f}, {hi:,.2f}]" for stat, (est, lo, hi) in stats.items()]
+        if parts:
+            lines.append(f"• {col}: " + "; ".join(parts))
+    if len(estimates) > max_columns:
+        lines.append(f"• … {len(estimates) - max_columns} more columns omitted")
+    return estimates, "\n".join(lines)
@@ -1,6 +1,6 @@
 # rosalind/tools/__init__.py
 
-from .loading import load_data
+from .loading import load_data, load_many
 from .cleaning import clean_data, detect_and_fix_issues
 from .visualization import (
     create_line_chart,
@@ -9,11 +9,17 @@ from .visualization import (
     create_dashboard,
     plot
 )
-from .powerbi import create_dax_snippets, generate_dax_measure
+from .powerbi import (
+    create_dax_snippets,
+    generate_dax_measure,
+    classify_columns,
+    generate_measure_library
+)
 
 # Master list – these are the functions the LLM can call
 __all__ = [
     "load_data",
+    "load_many",
     "clean_data",
     "detect_and_fix_issues",
     "create_line_chart",
@@ -22,5 +28,7 @@ __all__ = [
     "create_dashboard",
     "plot",
     "create_dax_snippets",
-    "generate_dax_measure"
+    "generate_dax_measure",
+    "classify_columns",
+    "generate_measure_library"
 ]
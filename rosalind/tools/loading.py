@@ -1,22 +1,220 @@
 # rosalind/tools/loading.py
+import os
+import glob
+import importlib.util
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
-def load_data(file_path: str) -> Tuple[pd.DataFrame, str]:
+CSV_SUFFIXES = {".csv"}
+EXCEL_SUFFIXES = {".xlsx", ".xls"}
+
+# Columns added to every frame loaded through load_many
+SOURCE_FILE_COL = "source_file"
+SOURCE_SHEET_COL = "source_sheet"
+
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def _fastest_engine(suffix: str) -> Optional[str]:
+    """
+    Pick the fastest installed pandas engine for a file type.
+    Falls back to pandas' own default when no faster engine is installed.
+    """
+    suffix = suffix.lower()
+    if suffix in CSV_SUFFIXES:
+        return "pyarrow" if _has_module("pyarrow") else "c"
+    if suffix in EXCEL_SUFFIXES:
+        return "calamine" if _has_module("python_calamine") else None
+    raise ValueError("Supported formats: CSV, XLSX")
+
+
+def _read_one(path: str, sheet: Optional[Union[str, int]], engine: Optional[str]) -> pd.DataFrame:
+    """Read a single CSV file or Excel sheet. Module-level so worker processes can pickle it."""
+    if Path(path).suffix.lower() in CSV_SUFFIXES:
+        return pd.read_csv(path, engine=engine)
+    return pd.read_excel(path, sheet_name=sheet, engine=engine)
+
+
+def _resolve_paths(source: Union[str, Iterable[str]]) -> List[Path]:
+    """Expand a file, folder, glob pattern or list of those into supported files."""
+    sources = [source] if isinstance(source, (str, Path)) else list(source)
+    paths: List[Path] = []
+    for item in sources:
+        item = str(item)
+        if Path(item).is_dir():
+            matches = sorted(str(p) for p in Path(item).iterdir())
+        elif glob.has_magic(item):
+            matches = sorted(glob.glob(item))
+        else:
+            if not Path(item).exists():
+                raise FileNotFoundError(f"File not found: {item}")
+            matches = [item]
+        paths.extend(
+            Path(m) for m in matches
+            if Path(m).suffix.lower() in CSV_SUFFIXES | EXCEL_SUFFIXES
+            # Skip hidden files and Excel lock files (~$Book.xlsx) of open workbooks
+            and not Path(m).name.startswith(("~$", "."))
+        )
+
+    if not paths:
+        raise FileNotFoundError(f"No CSV/XLSX files found for: {source}")
+    return paths
+
+
+def _unify_columns(frames: List[pd.DataFrame], labels: List[str]) -> Tuple[List[pd.DataFrame], List[str]]:
+    """
+    Align column names across frames: strip whitespace and map case-insensitive
+    matches onto the first spelling seen, so 'Amount ' and 'amount' become one column.
+    Every rename is reported; two columns of the same frame that collide keep
+    distinct names ('amount_2').
+    """
+    canonical: Dict[str, str] = {}
+    unified = []
+    notes = []
+    for frame, label in zip(frames, labels):
+        new_columns = []
+        for col in frame.columns:
+            name = str(col).strip()
+            target = canonical.setdefault(name.lower(), name)
+            if target in new_columns:
+                suffix = 2
+                while f"{target}_{suffix}" in new_columns:
+                    suffix += 1
+                notes.append(f"{label}: column '{col}' duplicates '{target}', renamed to '{target}_{suffix}'")
+                target = f"{target}_{suffix}"
+            elif target != col:
+                notes.append(f"{label}: column '{col}' renamed to '{target}'")
+            new_columns.append(target)
+        frame = frame.copy(deep=False)
+        frame.columns = new_columns
+        unified.append(frame)
+    return unified, notes
+
+
+def _compatible_dtypes(dtypes: List) -> bool:
+    """Same dtype, or all numeric (int64 vs float64 is usually just NaNs)."""
+    if len({str(d) for d in dtypes}) <= 1:
+        return True
+    return all(
+        pd.api.types.is_numeric_dtype(d) and not pd.api.types.is_bool_dtype(d)
+        for d in dtypes
+    )
+
+
+def schema_drift_report(frames: List[pd.DataFrame], labels: List[str]) -> List[str]:
+    """
+    Compare the schema of each loaded frame against the union of all columns.
+    Returns a list of human-readable findings (empty when every source matches).
+    """
+    all_columns: List[str] = []
+    for frame in frames:
+        all_columns.extend(c for c in frame.columns if c not in all_columns)
+
+    findings = []
+    for frame, label in zip(frames, labels):
+        missing = [c for c in all_columns if c not in frame.columns]
+        if missing:
+            findings.append(f"{label}: missing columns {missing}")
+
+    for col in all_columns:
+        dtypes = {
+            label: frame[col].dtype
+            for frame, label in zip(frames, labels)
+            if col in frame.columns
+        }
+        if not _compatible_dtypes(list(dtypes.values())):
+            detail = ", ".join(f"{label}={dtype}" for label, dtype in dtypes.items())
+            findings.append(f"Column '{col}' has mixed types: {detail}")
+
+    return findings
+
+
+def load_many(
+    source: Union[str, Iterable[str]],
+    sheet_name: Optional[Union[str, int, List[Union[str, int]]]] = None,
+    max_workers: Optional[int] = None
+) -> Tuple[pd.DataFrame, str]:
+    """
+    Load every sheet of one or more workbooks, or a folder/glob of CSVs, into one dataframe.
+
+    Each file (or sheet) is read in its own worker process with the fastest installed
+    engine. Columns are unified, every row is tagged with its source file and sheet,
+    and the description includes a schema-drift report.
+    sheet_name=None reads all sheets; pass a name/index or list to restrict.
+    """
+    paths = _resolve_paths(source)
+
+    tasks: List[Tuple[str, Optional[Union[str, int]], Optional[str]]] = []
+    for path in paths:
+        engine = _fastest_engine(path.suffix)
+        if path.suffix.lower() in CSV_SUFFIXES:
+            tasks.append((str(path), None, engine))
+            continue
+        with pd.ExcelFile(path, engine=engine) as workbook:
+            names = list(workbook.sheet_names)
+        if sheet_name is None:
+            sheets = names
+        else:
+            requested = sheet_name if isinstance(sheet_name, list) else [sheet_name]
+            # Resolve positional sheets to names so source_sheet is meaningful
+            sheets = [names[s] if isinstance(s, int) else s for s in requested]
+        tasks.extend((str(path), sheet, engine) for sheet in sheets)
+
+    workers = min(len(tasks), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        frames = [_read_one(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(_read_one, *zip(*tasks)))
+
+    labels = []
+    for path, sheet, _ in tasks:
+        name = Path(path).name
+        labels.append(f"{name}[{sheet}]" if sheet is not None else name)
+
+    frames, renames = _unify_columns(frames, labels)
+    for frame, (path, sheet, _) in zip(frames, tasks):
+        frame[SOURCE_FILE_COL] = Path(path).name
+        frame[SOURCE_SHEET_COL] = sheet
+
+    drift = renames + schema_drift_report(frames, labels)
+    df = pd.concat(frames, ignore_index=True, sort=False)
+
+    info = (
+        f"Loaded {len(tasks)} source(s) from {len(paths)} file(s): "
+        f"{df.shape[0]:,} rows × {df.shape[1]} columns"
+    )
+    if drift:
+        info += "\nSchema drift:\n• " + "\n• ".join(drift)
+    else:
+        info += "\nNo schema drift detected"
+    return df, info
+
+
+def load_data(
+    file_path: str,
+    sheet_name: Optional[Union[str, int]] = 0
+) -> Tuple[pd.DataFrame, str]:
     """
     Load CSV or Excel file. Returns dataframe and a short description.
+    Folders, glob patterns (e.g. 'data/daily_*.csv') and sheet_name=None
+    (all sheets) are loaded in parallel via load_many.
     """
+    if glob.has_magic(file_path) or Path(file_path).is_dir() or sheet_name is None:
+        return load_many(file_path, sheet_name=sheet_name)
+
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    if path.suffix.lower() in [".csv"]:
-        df = pd.read_csv(path)
-    elif path.suffix.lower() in [".xlsx", ".xls"]:
-        df = pd.read_excel(path)
-    else:
-        raise ValueError("Supported formats: CSV, XLSX")
+    # Single files keep pandas' default engines so dtypes match earlier releases;
+    # only load_many opts into the faster ones
+    _fastest_engine(path.suffix)
+    df = _read_one(str(path), sheet_name, None)
 
     info = f"Loaded {path.name}: {df.shape[0]:,} rows × {df.shape[1]} columns"
     return df, info
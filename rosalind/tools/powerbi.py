@@ -1,59 +1,200 @@
 # rosalind/tools/powerbi.py
-from typing import Dict, List, Optional
+from typing import Dict, Hashable, List, Optional, Tuple
+import numbers
+import re
 import textwrap
 
+import pandas as pd
+
+# Name tokens that mark a column as an identifier rather than something to sum
+KEY_TOKENS = {"id", "key", "code", "uuid", "ref", "reference", "msisdn", "phone"}
+CUSTOMER_TOKENS = {"customer", "client", "merchant", "account", "user", "member"}
+REVENUE_TOKENS = {"revenue", "sales", "amount"}
+DATE_TOKENS = {"date", "time", "timestamp", "datetime"}
+# Date parts ('Year' = 2024, 'Month' = 'Jan') slice the data; they are never summed
+DATE_PART_TOKENS = {"year", "quarter", "month", "week", "day"}
+
+# Text date columns are detected by parsing this many values; most must parse
+DATE_PARSE_SAMPLE = 1000
+DATE_PARSE_RATIO = 0.9
+
+# Text columns with more distinct values than this (and mostly unique) are treated as keys
+CATEGORY_MAX_UNIQUE = 50
+KEY_UNIQUE_RATIO = 0.5
+
+# (table_name, dataset version, schema signature) -> classification
+_CLASSIFICATION_CACHE: Dict[Tuple[str, Hashable, Tuple], Dict[str, List[str]]] = {}
+_CACHE_MAX_ENTRIES = 32
+
+
 def generate_dax_measure(
     measure_name: str,
     expression: str,
     description: str = "",
-    format_string: str = "#,##0"
+    format_string: str = "#,##0",
+    date_scoped: bool = True
 ) -> str:
     """
     Generate a clean, commented, production-ready DAX measure
     """
+    result = "__Result"
+    if date_scoped:
+        result = textwrap.dedent("""
+            IF(
+                ISINSCOPE('Date'),  -- Adjust table name if needed
+                __Result,
+                BLANK()
+            )
+        """).strip()
+
     template = f"""
 -- =============================================
 -- Measure: {measure_name}
 -- Description: {description or "No description provided"}
 -- Generated by Rosalind AI Analyst
 -- =============================================
-{measure_name} = 
-VAR __Result = 
-    {textwrap.indent(expression.strip(), "    ")}
+{measure_name} =
+VAR __Result =
+    {textwrap.indent(textwrap.dedent(expression).strip(), "    ").lstrip()}
 RETURN
-    IF(
-        ISINSCOPE('Date'),  -- Adjust table name if needed
-        __Result,
-        BLANK()
-    )
-    
+{textwrap.indent(result, "    ")}
+
 // Format: {format_string}
 """
     return textwrap.dedent(template).strip() + "\n"
 
 
+def _words(column: str) -> List[str]:
+    """Split snake_case, spaces and camelCase: 'TotalSales' / 'total_sales' -> ['Total', 'Sales']"""
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", str(column).strip())
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1 \2", name)
+    return [w for w in re.split(r"[^A-Za-z0-9]+", name) if w]
+
+
+def _tokens(column: str) -> set:
+    return {w.lower() for w in _words(column)}
+
+
+def _label(column: str) -> str:
+    """'unit_price' / 'UnitPrice' -> 'Unit Price' for measure names"""
+    return " ".join(w[0].upper() + w[1:] for w in _words(column))
+
+
+def _looks_like_dates(series: pd.Series) -> bool:
+    """Parse a slice of a text column; treat it as dates when nearly all values parse."""
+    values = series.dropna().head(DATE_PARSE_SAMPLE)
+    if values.empty:
+        return False
+    parsed = pd.to_datetime(values.astype(str), errors="coerce", format="mixed")
+    return parsed.notna().mean() >= DATE_PARSE_RATIO
+
+
+def _col_ref(table_name: str, column: str) -> str:
+    return f"'{table_name}'[{column}]"
+
+
+def classify_columns(
+    df: pd.DataFrame,
+    table_name: str = "Data",
+    version: Optional[Hashable] = None
+) -> Dict[str, List[str]]:
+    """
+    Classify every column once as a measure, key, date or category.
+
+    Results are cached per table name, schema (column names, dtypes, row count)
+    and version; pass ConversationMemory.version so the cache is also invalidated
+    when a new dataset with the same schema is loaded.
+    """
+    schema = (len(df), tuple((str(c), str(t)) for c, t in df.dtypes.items()))
+    cache_key = (table_name, version, schema)
+    if cache_key in _CLASSIFICATION_CACHE:
+        return {k: list(v) for k, v in _CLASSIFICATION_CACHE[cache_key].items()}
+
+    classes: Dict[str, List[str]] = {"measures": [], "keys": [], "dates": [], "categories": []}
+    row_count = max(len(df), 1)
+
+    for col in df.columns:
+        series = df[col]
+        tokens = _tokens(col)
+        if pd.api.types.is_datetime64_any_dtype(series):
+            classes["dates"].append(col)
+        elif pd.api.types.is_bool_dtype(series):
+            classes["categories"].append(col)
+        elif tokens & KEY_TOKENS:
+            classes["keys"].append(col)
+        elif tokens & DATE_TOKENS and not pd.api.types.is_numeric_dtype(series) and _looks_like_dates(series):
+            classes["dates"].append(col)
+        elif tokens & (DATE_TOKENS | DATE_PART_TOKENS):
+            classes["categories"].append(col)
+        elif pd.api.types.is_numeric_dtype(series):
+            classes["measures"].append(col)
+        else:
+            unique = series.nunique(dropna=True)
+            if unique > CATEGORY_MAX_UNIQUE and unique / row_count >= KEY_UNIQUE_RATIO:
+                classes["keys"].append(col)
+            else:
+                classes["categories"].append(col)
+
+    if len(_CLASSIFICATION_CACHE) >= _CACHE_MAX_ENTRIES:
+        _CLASSIFICATION_CACHE.pop(next(iter(_CLASSIFICATION_CACHE)))
+    _CLASSIFICATION_CACHE[cache_key] = {k: list(v) for k, v in classes.items()}
+    return classes
+
+
+def summarize_for_dax(
+    df: pd.DataFrame,
+    table_name: str = "Data",
+    version: Optional[Hashable] = None
+) -> Dict:
+    """
+    Build the df_summary dict used by the DAX tools straight from the dataset.
+    """
+    classes = classify_columns(df, table_name, version)
+    return {
+        "table_name": table_name,
+        "row_count": len(df),
+        "columns": list(df.columns),
+        "numeric_columns": classes["measures"],
+        "classification": classes,
+    }
+
+
+def _pick(columns: List[str], hints: set) -> List[str]:
+    return [c for c in columns if _tokens(c) & hints]
+
+
+def _customer_columns(classes: Dict[str, List[str]]) -> List[str]:
+    """Customer-like columns among keys and categories (e.g. a low-cardinality customer_name)."""
+    return _pick(classes.get("keys", []) + classes.get("categories", []), CUSTOMER_TOKENS)
+
+
 def generate_common_measures(df_summary: Dict) -> List[str]:
     """
     Auto-generate the most requested DAX measures based on data
     """
     measures = []
-    
+    table = df_summary.get("table_name", "Data")
+    classes = df_summary.get("classification") or {
+        "measures": df_summary.get("numeric_columns", []),
+        "keys": df_summary.get("columns", []),
+    }
+
     # Total Revenue
-    revenue_cols = [c for c in df_summary.get("numeric_columns", []) if "revenue" in c.lower() or "sales" in c.lower() or "amount" in c.lower()]
+    revenue_cols = _pick(classes["measures"], REVENUE_TOKENS)
     if revenue_cols:
         col = revenue_cols[0]
         measures.append(generate_dax_measure(
             measure_name="Total Revenue",
-            expression=f"SUM('{df_summary['table_name']}[{col}])",
+            expression=f"SUM({_col_ref(table, col)})",
             description="Sum of all revenue/sales",
             format_string="KES #,##0"
         ))
-        
+
         measures.append(generate_dax_measure(
             measure_name="YoY Growth %",
             expression=f"""
                 VAR CurrentPeriod = [Total Revenue]
-                VAR PreviousPeriod = 
+                VAR PreviousPeriod =
                     CALCULATE(
                         [Total Revenue],
                         DATEADD('Date'[Date], -1, YEAR)
@@ -64,16 +205,16 @@ def generate_common_measures(df_summary: Dict) -> List[str]:
             description="Year-over-Year revenue growth",
             format_string="0.0%"
         ))
-    
+
     # Customer Count
-    customer_cols = [c for c in df_summary.get("columns", []) if "customer" in c.lower() or "client" in c.lower()]
+    customer_cols = _customer_columns(classes)
     if customer_cols:
         measures.append(generate_dax_measure(
             measure_name="Active Customers",
-            expression=f"DISTINCTCOUNT('{df_summary['table_name']}[{customer_cols[0]}])",
+            expression=f"DISTINCTCOUNT({_col_ref(table, customer_cols[0])})",
             description="Number of unique customers"
         ))
-    
+
     # Average Transaction Value
     if revenue_cols and customer_cols:
         measures.append(generate_dax_measure(
@@ -82,24 +223,163 @@ def generate_common_measures(df_summary: Dict) -> List[str]:
             description="Average revenue per customer/transaction",
             format_string="KES #,##0"
         ))
-    
+
     return measures
 
 
-def create_dax_snippets(request: str, df_summary: Dict) -> str:
+def generate_measure_library(
+    df: pd.DataFrame,
+    table_name: str = "Data",
+    version: Optional[Hashable] = None,
+    date_column: Optional[str] = None
+) -> List[str]:
     """
-    Main tool called by the agent – returns ready-to-paste DAX
+    Emit a full measure library in one local call: totals and averages for every
+    numeric measure column, time intelligence when the data has a date column,
+    distinct counts for keys, and share-of-total / per-key ratios.
+    date_column defaults to the first detected date column of the table; pass
+    e.g. "'Date'[Date]" when the model has a separate date table.
     """
+    classes = classify_columns(df, table_name, version)
+    has_dates = bool(classes["dates"])
+    if has_dates and date_column is None:
+        date_column = _col_ref(table_name, classes["dates"][0])
+    customer_cols = _customer_columns(classes)
+    primary_key = (customer_cols or classes["keys"] or [None])[0]
+    measures = []
+
+    # Power BI rejects duplicate measure names (case-insensitive), e.g. from
+    # 'unit_price' + 'UnitPrice' or 'Sales' + 'Total Sales'
+    used_names: set = set()
+    used_labels: set = set()
+
+    def unique_name(*candidates: str) -> str:
+        for name in candidates:
+            if name.lower() not in used_names:
+                break
+        base, n = name, 2
+        while name.lower() in used_names:
+            name = f"{base} ({n})"
+            n += 1
+        used_names.add(name.lower())
+        return name
+
+    def column_label(col: str) -> str:
+        label = _label(col)
+        if label.lower() in used_labels:
+            label = str(col).strip()
+        used_labels.add(label.lower())
+        return label
+
+    distinct_names: Dict[str, str] = {}
+    distinct_cols = classes["keys"] + [c for c in customer_cols if c not in classes["keys"]]
+    for key in distinct_cols:
+        distinct_names[key] = unique_name(f"Distinct {column_label(key)}")
+        measures.append(generate_dax_measure(
+            distinct_names[key],
+            f"DISTINCTCOUNT({_col_ref(table_name, key)})",
+            f"Number of unique {key} values",
+            date_scoped=False
+        ))
+
+    for col in classes["measures"]:
+        label = column_label(col)
+        if label.lower().startswith("total "):
+            total_name = unique_name(label, f"Total {label}")
+        else:
+            total_name = unique_name(f"Total {label}")
+        total = f"[{total_name}]"
+        measures.append(generate_dax_measure(
+            total_name,
+            f"SUM({_col_ref(table_name, col)})",
+            f"Sum of {col}",
+            date_scoped=False
+        ))
+        measures.append(generate_dax_measure(
+            unique_name(f"Avg {label}"),
+            f"AVERAGE({_col_ref(table_name, col)})",
+            f"Average {col} per row",
+            format_string="#,##0.00",
+            date_scoped=False
+        ))
+        measures.append(generate_dax_measure(
+            unique_name(f"{label} % of Total"),
+            f"DIVIDE({total}, CALCULATE({total}, ALLSELECTED('{table_name}')))",
+            f"Share of {col} within the current selection",
+            format_string="0.0%",
+            date_scoped=False
+        ))
+        if primary_key is not None:
+            measures.append(generate_dax_measure(
+                unique_name(f"{label} per {_label(primary_key)}"),
+                f"DIVIDE({total}, [{distinct_names[primary_key]}])",
+                f"{col} per unique {primary_key}",
+                format_string="#,##0.00",
+                date_scoped=False
+            ))
+
+        if not has_dates:
+            continue
+        measures.append(generate_dax_measure(
+            unique_name(f"{label} MTD"),
+            f"CALCULATE({total}, DATESMTD({date_column}))",
+            f"Month-to-date {col}",
+            date_scoped=False
+        ))
+        measures.append(generate_dax_measure(
+            unique_name(f"{label} YTD"),
+            f"CALCULATE({total}, DATESYTD({date_column}))",
+            f"Year-to-date {col}",
+            date_scoped=False
+        ))
+        prior_name = unique_name(f"{label} PY")
+        measures.append(generate_dax_measure(
+            prior_name,
+            f"CALCULATE({total}, SAMEPERIODLASTYEAR({date_column}))",
+            f"{col} for the same period last year",
+            date_scoped=False
+        ))
+        measures.append(generate_dax_measure(
+            unique_name(f"{label} YoY %"),
+            f"DIVIDE({total} - [{prior_name}], [{prior_name}])",
+            f"Year-over-Year growth of {col}",
+            format_string="0.0%",
+            date_scoped=False
+        ))
+
+    return measures
+
+
+def create_dax_snippets(
+    request: str,
+    df_summary: Optional[Dict] = None,
+    df: Optional[pd.DataFrame] = None,
+    version: Optional[Hashable] = None
+) -> str:
+    """
+    Main tool called by the agent – returns ready-to-paste DAX.
+    Pass the dataframe (and ConversationMemory.version) to classify columns from
+    the actual data; a hand-built df_summary is still accepted.
+    """
+    df_summary = dict(df_summary or {})
+    if df is not None:
+        df_summary = {**summarize_for_dax(df, df_summary.get("table_name", "Data"), version), **df_summary}
+
     request_lower = request.lower()
+    row_count = df_summary.get("row_count")
     result = ["-- ROSALIND GENERATED DAX MEASURES"]
     result.append(f"-- Dataset: {df_summary.get('table_name', 'Data')}")
-    result.append(f"-- Rows: {df_summary.get('row_count', 'Unknown'):,}")
+    result.append(f"-- Rows: {row_count:,}" if isinstance(row_count, numbers.Integral) else "-- Rows: Unknown")
     result.append("")
 
+    # Full measure library for every relevant column
+    if df is not None and any(word in request_lower for word in ["library", "every", "full", "batch"]):
+        result.extend(generate_measure_library(df, df_summary["table_name"], version))
+
     # Common auto-measures
-    if any(word in request_lower for word in ["all", "common", "standard", "default"]):
+    elif any(word in request_lower for word in ["all", "common", "standard", "default"]):
         result.extend(generate_common_measures(df_summary))
-    
+
     # Specific requests
     if "yoy" in request_lower or "year over year" in request_lower:
         result.append(generate_dax_measure(
@@ -111,14 +391,14 @@ def create_dax_snippets(request: str, df_summary: Dict) -> str:
             """,
             "Year-over-Year growth percentage"
         ))
-    
+
     if "mtd" in request_lower:
         result.append(generate_dax_measure(
             "Revenue MTD",
             "CALCULATE([Total Revenue], DATESMTD('Date'[Date]))",
             "Month-to-Date Revenue"
         ))
-    
+
     if "running total" in request_lower:
         result.append(generate_dax_measure(
             "Revenue Running Total",
@@ -133,7 +413,7 @@ def create_dax_snippets(request: str, df_summary: Dict) -> str:
             """,
             "Cumulative revenue over time"
         ))
-    
+
     final_dax = "\n\n".join(result)
     print("DAX measures generated and ready for Power BI")
     return final_dax